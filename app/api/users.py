@@ -47,11 +47,11 @@ def create_user():
     data = request.get_json()
     if 'username' not in data or 'email' not in data or 'password' not in data:
         return bad_request('must include username, email and password fields')
-    if db.session.scalar(sa.select(User).where(
-            User.username == data['username'])):
+    if db.session.scalar(sa.select(sa.exists().where(
+            User.username == data['username']))):
         return bad_request('please use a different username')
-    if db.session.scalar(sa.select(User).where(
-            User.email == data['email'])):
+    if db.session.scalar(sa.select(sa.exists().where(
+            User.email == data['email']))):
         return bad_request('please use a different email address')
     user = User()
     user.from_dict(data, new_user=True)
@@ -69,12 +69,12 @@ def update_user(id):
     user = db.get_or_404(User, id)
     data = request.get_json()
     if 'username' in data and data['username'] != user.username and \
-        db.session.scalar(sa.select(User).where(
-            User.username == data['username'])):
+        db.session.scalar(sa.select(sa.exists().where(
+            User.username == data['username']))):
         return bad_request('please use a different username')
     if 'email' in data and data['email'] != user.email and \
-        db.session.scalar(sa.select(User).where(
-            User.email == data['email'])):
+        db.session.scalar(sa.select(sa.exists().where(
+            User.email == data['email']))):
         return bad_request('please use a different email address')
     user.from_dict(data, new_user=False)
     db.session.commit()
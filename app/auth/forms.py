@@ -6,31 +6,60 @@ from wtforms.validators import ValidationError, DataRequired, Email, EqualTo
 import sqlalchemy as sa
 from app import db
 from app.models import User
-import re
+
+_SPECIALS = "!@#$%^&*()_-+=[]{};:,.<>/?"
+
+# maps required characters to their class (L, U, D or S); anything else is
+# left unchanged, which is safe because no letter can survive as a class name
+_CLASSIFY = str.maketrans({
+    **dict.fromkeys("abcdefghijklmnopqrstuvwxyz", "L"),
+    **dict.fromkeys("ABCDEFGHIJKLMNOPQRSTUVWXYZ", "U"),
+    **dict.fromkeys("0123456789", "D"),
+    **dict.fromkeys(_SPECIALS, "S"),
+})
+
+_ERR_PREFIX = _l("Password must contain: ")
+_ERR_LEN = _l("at least 12 characters")
+_ERR_LOWER = _l("one lowercase letter (a–z)")
+_ERR_UPPER = _l("one uppercase letter (A–Z)")
+_ERR_DIGIT = _l("one digit (0–9)")
+_ERR_SPECIAL = _l("one special character: !@#$%^&*()_-+=[]{};:,.<>/?")
+
+
+def _password_error(errors):
+    return ValidationError(
+        str(_ERR_PREFIX) + ", ".join(str(e) for e in errors) + "."
+    )
+
 
 def validate_password_strength(form, field):
     password = field.data or ""
+
+    # too short to contain one character of each class: fail with every rule
+    if len(password) < 4:
+        raise _password_error((_ERR_LEN, _ERR_LOWER, _ERR_UPPER, _ERR_DIGIT,
+                               _ERR_SPECIAL))
+
     errors = []
+    classes = set(password.translate(_CLASSIFY))
 
     if len(password) < 12:
-        errors.append(_("at least 12 characters"))
+        errors.append(_ERR_LEN)
 
-    if not re.search(r"[a-z]", password):
-        errors.append(_("one lowercase letter (a–z)"))
+    if 'L' not in classes:
+        errors.append(_ERR_LOWER)
 
-    if not re.search(r"[A-Z]", password):
-        errors.append(_("one uppercase letter (A–Z)"))
+    if 'U' not in classes:
+        errors.append(_ERR_UPPER)
 
-    if not re.search(r"[0-9]", password):
-        errors.append(_("one digit (0–9)"))
+    if 'D' not in classes:
+        errors.append(_ERR_DIGIT)
 
-    if not re.search(r"[!@#$%^&*()_\-+=\[\]{};:,.<>/?]", password):
-        errors.append(_("one special character: !@#$%^&*()_-+=[]{};:,.<>/?"))
+    if 'S' not in classes:
+        errors.append(_ERR_SPECIAL)
 
     if errors:
-        raise ValidationError(
-            _("Password must contain: ") + ", ".join(errors) + "."
-        )
+        raise _password_error(errors)
 
 
 class LoginForm(FlaskForm):
@@ -53,17 +82,30 @@ class RegistrationForm(FlaskForm):
                                            EqualTo('password')])
     submit = SubmitField(_l('Register'))
 
-    def validate_username(self, username):
-        user = db.session.scalar(sa.select(User).where(
-            User.username == username.data))
-        if user is not None:
-            raise ValidationError(_('Please use a different username.'))
-
-    def validate_email(self, email):
-        user = db.session.scalar(sa.select(User).where(
-            User.email == email.data))
-        if user is not None:
-            raise ValidationError(_('Please use a different email address.'))
+    def validate(self, extra_validators=None):
+        rv = super().validate(extra_validators=extra_validators)
+        # check username and email uniqueness with a single query
+        conditions = []
+        if not self.username.errors:
+            conditions.append(User.username == self.username.data)
+        if not self.email.errors:
+            conditions.append(User.email == self.email.data)
+        if not conditions:
+            return rv
+        rows = db.session.execute(
+            sa.select(User.username, User.email).where(
+                sa.or_(*conditions))).all()
+        for row in rows:
+            if row.username == self.username.data and \
+                    not self.username.errors:
+                self.username.errors.append(
+                    _('Please use a different username.'))
+                rv = False
+            if row.email == self.email.data and not self.email.errors:
+                self.email.errors.append(
+                    _('Please use a different email address.'))
+                rv = False
+        return rv
 
 
 class ResetPasswordRequestForm(FlaskForm):
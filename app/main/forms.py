@@ -20,9 +20,9 @@ class EditProfileForm(FlaskForm):
 
     def validate_username(self, username):
         if username.data != self.original_username:
-            user = db.session.scalar(sa.select(User).where(
+            exists_q = sa.select(sa.exists().where(
                 User.username == username.data))
-            if user is not None:
+            if db.session.scalar(exists_q):
                 raise ValidationError(_('Please use a different username.'))
 
 
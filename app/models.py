@@ -132,14 +132,20 @@ class User(PaginatedAPIMixin, UserMixin, db.Model):
         return '<User {}>'.format(self.username)
 
     def set_password(self, password):
-        self.password_hash = generate_password_hash(password)
+        self.password_hash = generate_password_hash(
+            password, method=current_app.config['PASSWORD_HASH_METHOD'])
 
     def check_password(self, password):
         return check_password_hash(self.password_hash, password)
 
     def avatar(self, size):
-        digest = md5(self.email.lower().encode('utf-8')).hexdigest()
-        return f'https://www.gravatar.com/avatar/{digest}?d=identicon&s={size}'
+        # cache the digest per instance, recomputing it if the email changes
+        if getattr(self, '_avatar_email', None) != self.email:
+            self._avatar_digest = md5(self.email.lower().encode('utf-8'),
+                                      usedforsecurity=False).hexdigest()
+            self._avatar_email = self.email
+        return (f'https://www.gravatar.com/avatar/{self._avatar_digest}'
+                f'?d=identicon&s={size}')
 
     def follow(self, user):
         if not self.is_following(user):
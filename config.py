@@ -10,15 +10,20 @@ def str_to_bool(value: str, default=False):
     return value.strip().lower() in ("1", "true", "t", "yes", "y")
 
 
+_database_url = os.environ.get('DATABASE_URL', '')
+if _database_url.startswith('postgres://'):
+    _database_url = 'postgresql://' + _database_url[len('postgres://'):]
+
+
 
 
 class Config:
     SECRET_KEY = os.environ.get('SECRET_KEY') or 'you-will-never-guess'
     SERVER_NAME = os.environ.get('SERVER_NAME')
-    SQLALCHEMY_DATABASE_URI = os.environ.get('DATABASE_URL', '').replace(
-        'postgres://', 'postgresql://') or \
+    SQLALCHEMY_DATABASE_URI = _database_url or \
         'sqlite:///' + os.path.join(basedir, 'app.db')
     LOG_TO_STDOUT = os.environ.get('LOG_TO_STDOUT')
+    PASSWORD_HASH_METHOD = 'scrypt'
 
      # --- Email config ---
     MAIL_SERVER = os.environ.get('MAIL_SERVER', 'localhost')
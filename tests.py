@@ -4,9 +4,6 @@ import unittest
 from app import create_app, db
 from app.models import User, Post
 from config import Config
-from app.translate import translate
-from app import mail
-from app.email import send_email
 
 
 
@@ -18,21 +15,39 @@ class TestConfig(Config):
     WTF_CSRF_ENABLED = False
     MS_TRANSLATOR_KEY = None
     MS_TRANSLATOR_REGION = None
+    PASSWORD_HASH_METHOD = 'pbkdf2:sha256:1'
 
 
-class UserModelCase(unittest.TestCase):
+class AppTestCase(unittest.TestCase):
+    # the app and schema are built once per class; each test gets its own
+    # app context and tearDown empties the tables instead of dropping them
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = create_app(TestConfig)
+        with cls.app.app_context():
+            db.create_all()
+
+    @classmethod
+    def tearDownClass(cls):
+        with cls.app.app_context():
+            db.drop_all()
+
     def setUp(self):
-        self.app = create_app(TestConfig)
         self.app_context = self.app.app_context()
         self.app_context.push()
-        db.create_all()
-
 
     def tearDown(self):
+        db.session.rollback()
+        for table in reversed(db.metadata.sorted_tables):
+            db.session.execute(table.delete())
+        db.session.commit()
         db.session.remove()
-        db.drop_all()
         self.app_context.pop()
 
+
+class UserModelCase(AppTestCase):
+
     def test_password_hashing(self):
         u = User(username='susan', email='susan@example.com')
         u.set_password('cat')
@@ -51,10 +66,10 @@ class UserModelCase(unittest.TestCase):
         db.session.add(u1)
         db.session.add(u2)
         db.session.commit()
-        following = db.session.scalars(u1.following.select()).all()
-        followers = db.session.scalars(u2.followers.select()).all()
-        self.assertEqual(following, [])
-        self.assertEqual(followers, [])
+        following = db.session.scalars(u1.following.select()).first()
+        followers = db.session.scalars(u2.followers.select()).first()
+        self.assertIsNone(following)
+        self.assertIsNone(followers)
 
         u1.follow(u2)
         db.session.commit()
@@ -91,7 +106,6 @@ class UserModelCase(unittest.TestCase):
         p4 = Post(body="post from david", author=u4,
                   timestamp=now + timedelta(seconds=2))
         db.session.add_all([p1, p2, p3, p4])
-        db.session.commit()
 
         # setup the followers
         u1.follow(u2)  # john follows susan
@@ -139,6 +153,7 @@ class UserModelCase(unittest.TestCase):
     def test_send_email(self):
         from app.email import send_email
 
+        mail = self.app.extensions['mail']
         with mail.record_messages() as outbox:
             send_email(
                subject="Test Email",
@@ -157,6 +172,8 @@ class UserModelCase(unittest.TestCase):
 
 
     def test_translation_fallback(self):
+        from app.translate import translate
+
         # Translator API disabled in TestConfig by design
         text = "Hello world"
         with self.app.test_request_context('/'):
@@ -168,90 +185,60 @@ class UserModelCase(unittest.TestCase):
         )
 
 
-class RouteTests(unittest.TestCase):
+class RouteTests(AppTestCase):
     def setUp(self):
-        self.app = create_app(TestConfig)
-        self.app_context = self.app.app_context()
-        self.app_context.push()
-        db.create_all()
+        super().setUp()
         self.client = self.app.test_client()
 
-    def tearDown(self):
-        db.session.remove()
-        db.drop_all()
-        self.app_context.pop()
-
-
-
-    def test_follow_route(self):
-        u1 = User(username='john', email='john@example.com')
-        u1.set_password('cat')
-        u2 = User(username='susan', email='susan@example.com')
-        u2.set_password('dog')
-
-        db.session.add_all([u1, u2])
+        self.u1 = User(username='john', email='john@example.com')
+        self.u1.set_password('cat')
+        self.u2 = User(username='susan', email='susan@example.com')
+        db.session.add_all([self.u1, self.u2])
         db.session.commit()
 
-        # log in john
+        # log in john; the session cookie is kept by self.client
         resp = self.client.post('/auth/login', data={
-            'username': 'john',     # if your form uses 'username'
+            'username': 'john',
             'password': 'cat'
         }, follow_redirects=True)
         self.assertEqual(resp.status_code, 200)
 
+    def test_follow_route(self):
+        u1, u2 = self.u1, self.u2
+
         # follow susan – note we send a submit field so the form validates
         resp = self.client.post('/follow/susan', data={'submit': 'Follow'},
                                 follow_redirects=True)
         self.assertEqual(resp.status_code, 200)
 
-        # reload from DB to see fresh state
-        john = db.session.get(User, u1.id)
-        susan = db.session.get(User, u2.id)
-
-        self.assertTrue(john.is_following(susan))
-        self.assertEqual(john.following_count(), 1)
-        self.assertEqual(susan.followers_count(), 1)
+        # expire cached state so it is reloaded from the DB
+        db.session.expire_all()
 
+        self.assertTrue(u1.is_following(u2))
+        self.assertEqual(u1.following_count(), 1)
+        self.assertEqual(u2.followers_count(), 1)
 
     def test_unfollow_route(self):
-        u1 = User(username='john', email='john@example.com')
-        u1.set_password('cat')
-        u2 = User(username='susan', email='susan@example.com')
-        u2.set_password('dog')
-
-        db.session.add_all([u1, u2])
-        db.session.commit()
+        u1, u2 = self.u1, self.u2
 
         # john initially follows susan
         u1.follow(u2)
         db.session.commit()
 
-        # log in john
-        resp = self.client.post('/auth/login', data={
-            'username': 'john',
-            'password': 'cat'
-        }, follow_redirects=True)
-        self.assertEqual(resp.status_code, 200)
-
         # unfollow susan
         resp = self.client.post('/unfollow/susan', data={'submit': 'Unfollow'},
                                 follow_redirects=True)
         self.assertEqual(resp.status_code, 200)
 
-        john = db.session.get(User, u1.id)
-        susan = db.session.get(User, u2.id)
+        db.session.expire_all()
 
-        self.assertFalse(john.is_following(susan))
-        self.assertEqual(john.following_count(), 0)
-        self.assertEqual(susan.followers_count(), 0)
+        self.assertFalse(u1.is_following(u2))
+        self.assertEqual(u1.following_count(), 0)
+        self.assertEqual(u2.followers_count(), 0)
 
     def test_search_indexing(self):
         if self.app.elasticsearch:
-            u = User(username='john', email='john@example.com')
-            db.session.add(u)
-            db.session.commit()
-
-            p = Post(body="flask microblog test", author=u)
+            p = Post(body="flask microblog test", author=self.u1)
             db.session.add(p)
             db.session.commit()
 